@@ -5,9 +5,16 @@ Highlights word-level and character-level differences with colors.
 """
 
 import argparse
+import collections
 import difflib
+import functools
 import sys
 
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # optional accelerator, fall back to difflib
+    Indel = None
+
 
 class Color:
     """ANSI color codes for terminal output."""
@@ -23,10 +30,56 @@ class Color:
     BG_RED = '\033[41m'
     BG_GREEN = '\033[42m'
 
+    # Prebuilt prefixes for the per-word highlights in diff_texts
+    CHAR_DELETED = BG_RED + BOLD
+    CHAR_INSERTED = BG_GREEN + BOLD
+    WORD_REPLACED_SRC = RED + UNDERLINE
+    WORD_REPLACED_OCR = GREEN + UNDERLINE
+    WORD_DELETED = RED + BOLD
+    WORD_INSERTED = GREEN + BOLD
+
+
+def is_similar(word1, word2):
+    """Return True if two words are close enough to be an OCR misread."""
+    # The ratio can be at most 2*lo/(lo+hi), which is <= 0.5 once hi >= 3*lo
+    lo, hi = sorted((len(word1), len(word2)))
+    if 3 * lo <= hi:
+        return False
+    if Indel is not None:
+        # Same as fuzz.ratio() > 50 without the scorer wrapper
+        return Indel.normalized_distance(word1, word2) < 0.5
+    return difflib.SequenceMatcher(a=word1, b=word2, autojunk=False).ratio() > 0.5
+
+
+def contained_char_diff(short, long, prefix):
+    """Highlight the characters of long around its first copy of short.
+
+    This is exactly what SequenceMatcher produces when short occurs in
+    long, so the common "extra punctuation" OCR errors skip the matcher.
+    Returns None when short is not a substring of long.
+    """
+    start = long.find(short)
+    if start < 0:
+        return None
+    end = start + len(short)
+    head = prefix + long[:start] + Color.RESET if start else ''
+    tail = prefix + long[end:] + Color.RESET if end < len(long) else ''
+    return head + short + tail
+
 
+@functools.lru_cache(maxsize=4096)
 def char_diff_highlight(word1, word2):
     """Show character-level diff between two similar words."""
-    matcher = difflib.SequenceMatcher(None, word1, word2)
+    if len(word1) <= len(word2):
+        highlighted = contained_char_diff(word1, word2, Color.CHAR_INSERTED)
+        if highlighted is not None:
+            return word1, highlighted
+    else:
+        highlighted = contained_char_diff(word2, word1, Color.CHAR_DELETED)
+        if highlighted is not None:
+            return highlighted, word2
+
+    matcher = difflib.SequenceMatcher(a=word1, b=word2, autojunk=False)
     result1_parts = []
     result2_parts = []
 
@@ -35,24 +88,43 @@ def char_diff_highlight(word1, word2):
             result1_parts.append(word1[i1:i2])
             result2_parts.append(word2[j1:j2])
         elif tag == 'replace':
-            result1_parts.append(f"{Color.BG_RED}{Color.BOLD}{word1[i1:i2]}{Color.RESET}")
-            result2_parts.append(f"{Color.BG_GREEN}{Color.BOLD}{word2[j1:j2]}{Color.RESET}")
+            result1_parts.append(Color.CHAR_DELETED + word1[i1:i2] + Color.RESET)
+            result2_parts.append(Color.CHAR_INSERTED + word2[j1:j2] + Color.RESET)
         elif tag == 'delete':
-            result1_parts.append(f"{Color.BG_RED}{Color.BOLD}{word1[i1:i2]}{Color.RESET}")
+            result1_parts.append(Color.CHAR_DELETED + word1[i1:i2] + Color.RESET)
         elif tag == 'insert':
-            result2_parts.append(f"{Color.BG_GREEN}{Color.BOLD}{word2[j1:j2]}{Color.RESET}")
+            result2_parts.append(Color.CHAR_INSERTED + word2[j1:j2] + Color.RESET)
 
     return ''.join(result1_parts), ''.join(result2_parts)
 
 
+# Result of diff_texts; the word lists and opcodes are kept so generate_html
+# can render the same alignment without splitting or diffing again
+DiffResult = collections.namedtuple(
+    'DiffResult',
+    ['highlighted1', 'highlighted2', 'stats', 'differences', 'words1', 'words2', 'opcodes'],
+)
+
+
 def diff_texts(text1, text2):
     """
     Compare two texts word by word and return highlighted versions.
+
+    Returns a DiffResult with the highlighted words of each text, stats,
+    differences, and the split word lists and opcodes they were built from.
+    The highlighted words are left as lists and only joined for display
+    by print_output.
     """
     words1 = text1.split()
     words2 = text2.split()
 
-    matcher = difflib.SequenceMatcher(None, words1, words2)
+    # Local names for the color codes used per word in the loop below
+    src_pre, ocr_pre = Color.WORD_REPLACED_SRC, Color.WORD_REPLACED_OCR
+    del_pre, ins_pre = Color.WORD_DELETED + '[', Color.WORD_INSERTED + '['
+    reset, bracket_reset = Color.RESET, ']' + Color.RESET
+
+    matcher = difflib.SequenceMatcher(a=words1, b=words2, autojunk=False)
+    opcodes = matcher.get_opcodes()
 
     result1 = []
     result2 = []
@@ -69,7 +141,7 @@ def diff_texts(text1, text2):
 
     differences = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == 'equal':
             result1.extend(words1[i1:i2])
             result2.extend(words2[j1:j2])
@@ -83,42 +155,41 @@ def diff_texts(text1, text2):
             if len(src_words) == len(ocr_words):
                 # One-to-one replacement - show char-level diff
                 for w1, w2 in zip(src_words, ocr_words):
-                    ratio = difflib.SequenceMatcher(None, w1, w2).ratio()
-                    if ratio > 0.5:  # Similar words - show char diff
+                    if is_similar(w1, w2):  # Similar words - show char diff
                         h1, h2 = char_diff_highlight(w1, w2)
                         result1.append(h1)
                         result2.append(h2)
                         stats['similar'] += 1
                         differences.append((w1, w2, 'similar'))
                     else:  # Very different - highlight whole word
-                        result1.append(f"{Color.RED}{Color.UNDERLINE}{w1}{Color.RESET}")
-                        result2.append(f"{Color.GREEN}{Color.UNDERLINE}{w2}{Color.RESET}")
+                        result1.append(src_pre + w1 + reset)
+                        result2.append(ocr_pre + w2 + reset)
                         stats['replaced'] += 1
                         differences.append((w1, w2, 'replaced'))
             else:
                 # Different number of words - highlight chunks
                 for w in src_words:
-                    result1.append(f"{Color.RED}{Color.UNDERLINE}{w}{Color.RESET}")
+                    result1.append(src_pre + w + reset)
                     stats['deleted'] += 1
                     differences.append((w, '', 'deleted'))
                 for w in ocr_words:
-                    result2.append(f"{Color.GREEN}{Color.UNDERLINE}{w}{Color.RESET}")
+                    result2.append(ocr_pre + w + reset)
                     stats['inserted'] += 1
                     differences.append(('', w, 'inserted'))
 
         elif tag == 'delete':
             for w in words1[i1:i2]:
-                result1.append(f"{Color.RED}{Color.BOLD}[{w}]{Color.RESET}")
+                result1.append(del_pre + w + bracket_reset)
                 stats['deleted'] += 1
                 differences.append((w, '', 'deleted'))
 
         elif tag == 'insert':
             for w in words2[j1:j2]:
-                result2.append(f"{Color.GREEN}{Color.BOLD}[{w}]{Color.RESET}")
+                result2.append(ins_pre + w + bracket_reset)
                 stats['inserted'] += 1
                 differences.append(('', w, 'inserted'))
 
-    return ' '.join(result1), ' '.join(result2), stats, differences
+    return DiffResult(result1, result2, stats, differences, words1, words2, opcodes)
 
 
 def print_legend():
@@ -137,30 +208,32 @@ def print_differences_list(differences):
         print(f"{Color.GREEN}No differences found!{Color.RESET}")
         return
 
-    print(f"{Color.BOLD}{Color.CYAN}═══ DIFFERENCES LIST ═══{Color.RESET}")
+    # Build the whole list and write it once; it can run to thousands of rows
+    yellow, red, green, reset = Color.YELLOW, Color.RED, Color.GREEN, Color.RESET
+    lines = [f"{Color.BOLD}{Color.CYAN}═══ DIFFERENCES LIST ═══{reset}"]
     for i, (src, ocr, diff_type) in enumerate(differences, 1):
         if diff_type == 'similar':
-            print(f"  {i:3}. {Color.YELLOW}'{src}'{Color.RESET} → {Color.YELLOW}'{ocr}'{Color.RESET}")
+            lines.append(f"  {i:3}. {yellow}'{src}'{reset} → {yellow}'{ocr}'{reset}")
         elif diff_type == 'replaced':
-            print(f"  {i:3}. {Color.RED}'{src}'{Color.RESET} → {Color.GREEN}'{ocr}'{Color.RESET}")
+            lines.append(f"  {i:3}. {red}'{src}'{reset} → {green}'{ocr}'{reset}")
         elif diff_type == 'deleted':
-            print(f"  {i:3}. {Color.RED}DELETED: '{src}'{Color.RESET}")
+            lines.append(f"  {i:3}. {red}DELETED: '{src}'{reset}")
         elif diff_type == 'inserted':
-            print(f"  {i:3}. {Color.GREEN}INSERTED: '{ocr}'{Color.RESET}")
-    print()
+            lines.append(f"  {i:3}. {green}INSERTED: '{ocr}'{reset}")
+    lines.append('\n')
+    sys.stdout.write('\n'.join(lines))
 
 
-def print_output(text1, text2, stats, differences, show_list=True):
+def print_output(highlighted1, highlighted2, stats, differences, show_list=True):
     """Print inline diff with summary."""
     print_legend()
 
-    print(f"{Color.BOLD}{Color.CYAN}═══ SOURCE TEXT (with errors marked) ═══{Color.RESET}")
-    print(text1)
-    print()
-
-    print(f"{Color.BOLD}{Color.CYAN}═══ OCR OUTPUT (with errors marked) ═══{Color.RESET}")
-    print(text2)
-    print()
+    sys.stdout.write(
+        f"{Color.BOLD}{Color.CYAN}═══ SOURCE TEXT (with errors marked) ═══{Color.RESET}\n"
+        f"{' '.join(highlighted1)}\n\n"
+        f"{Color.BOLD}{Color.CYAN}═══ OCR OUTPUT (with errors marked) ═══{Color.RESET}\n"
+        f"{' '.join(highlighted2)}\n\n"
+    )
 
     if show_list:
         print_differences_list(differences)
@@ -181,104 +254,60 @@ def print_output(text1, text2, stats, differences, show_list=True):
     print(f"  {Color.BOLD}Word accuracy:     {accuracy:.1f}%{Color.RESET}")
 
 
-def generate_html(text1_raw, text2_raw, stats, differences, output_file):
-    """Generate an HTML file with highlighted differences."""
-    # Re-process for HTML output
-    words1 = text1_raw.split()
-    words2 = text2_raw.split()
-    matcher = difflib.SequenceMatcher(None, words1, words2)
-
-    html_text1 = []
-    html_text2 = []
-
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == 'equal':
-            html_text1.extend(words1[i1:i2])
-            html_text2.extend(words2[j1:j2])
-        elif tag == 'replace':
-            src_words = words1[i1:i2]
-            ocr_words = words2[j1:j2]
-            if len(src_words) == len(ocr_words):
-                for w1, w2 in zip(src_words, ocr_words):
-                    html_text1.append(f'<span class="error" title="OCR: {w2}">{w1}</span>')
-                    html_text2.append(f'<span class="error" title="Source: {w1}">{w2}</span>')
-            else:
-                for w in src_words:
-                    html_text1.append(f'<span class="deleted">{w}</span>')
-                for w in ocr_words:
-                    html_text2.append(f'<span class="inserted">{w}</span>')
-        elif tag == 'delete':
-            for w in words1[i1:i2]:
-                html_text1.append(f'<span class="deleted">{w}</span>')
-        elif tag == 'insert':
-            for w in words2[j1:j2]:
-                html_text2.append(f'<span class="inserted">{w}</span>')
-
-    # Generate differences table
-    diff_rows = []
-    for i, (src, ocr, diff_type) in enumerate(differences, 1):
-        if diff_type == 'similar':
-            diff_rows.append(f'<tr class="similar"><td>{i}</td><td>{src}</td><td>→</td><td>{ocr}</td></tr>')
-        elif diff_type == 'replaced':
-            diff_rows.append(f'<tr class="replaced"><td>{i}</td><td>{src}</td><td>→</td><td>{ocr}</td></tr>')
-        elif diff_type == 'deleted':
-            diff_rows.append(f'<tr class="deleted"><td>{i}</td><td>{src}</td><td>→</td><td>(deleted)</td></tr>')
-        elif diff_type == 'inserted':
-            diff_rows.append(f'<tr class="inserted"><td>{i}</td><td>(none)</td><td>→</td><td>{ocr}</td></tr>')
-
-    accuracy = (stats['equal'] / stats['total_words1'] * 100) if stats['total_words1'] > 0 else 0
-    total_errors = stats['similar'] + stats['replaced'] + stats['deleted'] + stats['inserted']
-
-    html = f"""<!DOCTYPE html>
+# Fragments of the generate_html report; HTML_STATS and HTML_DIFFERENCES
+# are filled in with str.format_map, the rest are written as-is
+HTML_HEAD = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>OCR Diff Comparison</title>
     <style>
-        body {{ font-family: Georgia, serif; margin: 20px; background: #f5f5f5; line-height: 1.6; }}
-        .container {{ max-width: 1400px; margin: 0 auto; }}
-        h1 {{ color: #333; text-align: center; }}
-        .panel {{ background: white; padding: 20px; margin: 15px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .panel h2 {{ margin-top: 0; color: #444; border-bottom: 2px solid #007acc; padding-bottom: 10px; }}
-        .text {{ line-height: 2; font-size: 16px; }}
-        .error {{ background: #fff3cd; border-bottom: 2px solid #ffc107; cursor: help; }}
-        .deleted {{ background: #f8d7da; text-decoration: line-through; color: #721c24; }}
-        .inserted {{ background: #d4edda; color: #155724; }}
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 15px; }}
-        .stat-box {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; text-align: center; }}
-        .stat-box.good {{ background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); }}
-        .stat-box.warn {{ background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }}
-        .stat-box .value {{ font-size: 28px; font-weight: bold; }}
-        .stat-box .label {{ font-size: 12px; opacity: 0.9; text-transform: uppercase; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th, td {{ padding: 8px 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background: #f8f9fa; }}
-        tr.similar td {{ background: #fff3cd; }}
-        tr.replaced td {{ background: #ffe6e6; }}
-        tr.deleted td {{ background: #f8d7da; }}
-        tr.inserted td {{ background: #d4edda; }}
-        .legend {{ display: flex; gap: 20px; flex-wrap: wrap; padding: 10px; background: #f8f9fa; border-radius: 5px; }}
-        .legend-item {{ display: flex; align-items: center; gap: 5px; }}
-        .legend-color {{ width: 20px; height: 20px; border-radius: 3px; }}
+        body { font-family: Georgia, serif; margin: 20px; background: #f5f5f5; line-height: 1.6; }
+        .container { max-width: 1400px; margin: 0 auto; }
+        h1 { color: #333; text-align: center; }
+        .panel { background: white; padding: 20px; margin: 15px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .panel h2 { margin-top: 0; color: #444; border-bottom: 2px solid #007acc; padding-bottom: 10px; }
+        .text { line-height: 2; font-size: 16px; }
+        .error { background: #fff3cd; border-bottom: 2px solid #ffc107; cursor: help; }
+        .deleted { background: #f8d7da; text-decoration: line-through; color: #721c24; }
+        .inserted { background: #d4edda; color: #155724; }
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 15px; }
+        .stat-box { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; text-align: center; }
+        .stat-box.good { background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); }
+        .stat-box.warn { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }
+        .stat-box .value { font-size: 28px; font-weight: bold; }
+        .stat-box .label { font-size: 12px; opacity: 0.9; text-transform: uppercase; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { padding: 8px 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background: #f8f9fa; }
+        tr.similar td { background: #fff3cd; }
+        tr.replaced td { background: #ffe6e6; }
+        tr.deleted td { background: #f8d7da; }
+        tr.inserted td { background: #d4edda; }
+        .legend { display: flex; gap: 20px; flex-wrap: wrap; padding: 10px; background: #f8f9fa; border-radius: 5px; }
+        .legend-item { display: flex; align-items: center; gap: 5px; }
+        .legend-color { width: 20px; height: 20px; border-radius: 3px; }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>OCR Diff Comparison</h1>
 
-        <div class="panel">
+"""
+
+HTML_STATS = """        <div class="panel">
             <h2>Statistics</h2>
             <div class="stats">
                 <div class="stat-box">
-                    <div class="value">{stats['total_words1']}</div>
+                    <div class="value">{total_words1}</div>
                     <div class="label">Source Words</div>
                 </div>
                 <div class="stat-box">
-                    <div class="value">{stats['total_words2']}</div>
+                    <div class="value">{total_words2}</div>
                     <div class="label">OCR Words</div>
                 </div>
                 <div class="stat-box good">
-                    <div class="value">{stats['equal']}</div>
+                    <div class="value">{equal}</div>
                     <div class="label">Exact Matches</div>
                 </div>
                 <div class="stat-box warn">
@@ -292,7 +321,9 @@ def generate_html(text1_raw, text2_raw, stats, differences, output_file):
             </div>
         </div>
 
-        <div class="panel">
+"""
+
+HTML_LEGEND = """        <div class="panel">
             <h2>Legend</h2>
             <div class="legend">
                 <div class="legend-item"><span class="legend-color" style="background:#fff3cd;border:1px solid #ffc107;"></span> OCR Error (hover for details)</div>
@@ -303,27 +334,106 @@ def generate_html(text1_raw, text2_raw, stats, differences, output_file):
 
         <div class="panel">
             <h2>Source Text</h2>
-            <div class="text">{' '.join(html_text1)}</div>
+            <div class="text">"""
+
+HTML_MID = """</div>
         </div>
 
         <div class="panel">
             <h2>OCR Output</h2>
-            <div class="text">{' '.join(html_text2)}</div>
+            <div class="text">"""
+
+HTML_DIFFERENCES = """</div>
         </div>
 
         <div class="panel">
-            <h2>Differences List ({len(differences)} items)</h2>
+            <h2>Differences List ({difference_count} items)</h2>
             <table>
                 <tr><th>#</th><th>Source</th><th></th><th>OCR</th></tr>
-                {''.join(diff_rows)}
+                """
+
+HTML_TAIL = """
             </table>
         </div>
     </div>
 </body>
 </html>"""
 
+
+# Translation table for escaping words placed in HTML text and attributes
+HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# Bound format methods for the per-word HTML spans
+SRC_ERROR_SPAN = '<span class="error" title="OCR: {}">{}</span>'.format
+OCR_ERROR_SPAN = '<span class="error" title="Source: {}">{}</span>'.format
+DELETED_SPAN = '<span class="deleted">{}</span>'.format
+INSERTED_SPAN = '<span class="inserted">{}</span>'.format
+
+
+def generate_html(words1, words2, opcodes, stats, differences, output_file):
+    """Generate an HTML file with highlighted differences."""
+    # Escape every word once; the opcode indices still line up
+    words1 = [w.translate(HTML_ESCAPE) for w in words1]
+    words2 = [w.translate(HTML_ESCAPE) for w in words2]
+
+    html_text1 = []
+    html_text2 = []
+
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == 'equal':
+            html_text1.extend(words1[i1:i2])
+            html_text2.extend(words2[j1:j2])
+        elif tag == 'replace':
+            src_words = words1[i1:i2]
+            ocr_words = words2[j1:j2]
+            if len(src_words) == len(ocr_words):
+                html_text1.extend(map(SRC_ERROR_SPAN, ocr_words, src_words))
+                html_text2.extend(map(OCR_ERROR_SPAN, src_words, ocr_words))
+            else:
+                html_text1.extend(map(DELETED_SPAN, src_words))
+                html_text2.extend(map(INSERTED_SPAN, ocr_words))
+        elif tag == 'delete':
+            html_text1.extend(map(DELETED_SPAN, words1[i1:i2]))
+        elif tag == 'insert':
+            html_text2.extend(map(INSERTED_SPAN, words2[j1:j2]))
+
+    # Generate differences table
+    diff_rows = []
+    for i, (src, ocr, diff_type) in enumerate(differences, 1):
+        src = src.translate(HTML_ESCAPE)
+        ocr = ocr.translate(HTML_ESCAPE)
+        if diff_type == 'similar':
+            diff_rows.append(f'<tr class="similar"><td>{i}</td><td>{src}</td><td>→</td><td>{ocr}</td></tr>')
+        elif diff_type == 'replaced':
+            diff_rows.append(f'<tr class="replaced"><td>{i}</td><td>{src}</td><td>→</td><td>{ocr}</td></tr>')
+        elif diff_type == 'deleted':
+            diff_rows.append(f'<tr class="deleted"><td>{i}</td><td>{src}</td><td>→</td><td>(deleted)</td></tr>')
+        elif diff_type == 'inserted':
+            diff_rows.append(f'<tr class="inserted"><td>{i}</td><td>(none)</td><td>→</td><td>{ocr}</td></tr>')
+
+    accuracy = (stats['equal'] / stats['total_words1'] * 100) if stats['total_words1'] > 0 else 0
+    total_errors = stats['similar'] + stats['replaced'] + stats['deleted'] + stats['inserted']
+
+    fields = dict(
+        stats,
+        total_errors=total_errors,
+        accuracy=accuracy,
+        difference_count=len(differences),
+    )
+
+    # Stream the report in pieces instead of building it as one string
     with open(output_file, 'w') as f:
-        f.write(html)
+        f.writelines([
+            HTML_HEAD,
+            HTML_STATS.format_map(fields),
+            HTML_LEGEND,
+            ' '.join(html_text1),
+            HTML_MID,
+            ' '.join(html_text2),
+            HTML_DIFFERENCES.format_map(fields),
+        ])
+        f.writelines(diff_rows)
+        f.write(HTML_TAIL)
     print(f"{Color.GREEN}HTML output saved to: {output_file}{Color.RESET}")
 
 
@@ -351,6 +461,8 @@ Examples:
         for attr in dir(Color):
             if not attr.startswith('_'):
                 setattr(Color, attr, '')
+        # Cached highlights embed the old color codes
+        char_diff_highlight.cache_clear()
 
     try:
         with open(args.file1, 'r') as f:
@@ -361,12 +473,18 @@ Examples:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    highlighted1, highlighted2, stats, differences = diff_texts(text1, text2)
+    result = diff_texts(text1, text2)
 
     if args.html:
-        generate_html(text1, text2, stats, differences, args.html)
-
-    print_output(highlighted1, highlighted2, stats, differences, not args.no_list)
+        generate_html(
+            result.words1, result.words2, result.opcodes,
+            result.stats, result.differences, args.html
+        )
+
+    print_output(
+        result.highlighted1, result.highlighted2,
+        result.stats, result.differences, not args.no_list
+    )
 
 
 if __name__ == '__main__':
@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 import json
 import os
+import shutil
 import urllib.request
 import ssl
+from concurrent.futures import ThreadPoolExecutor
 
 # Create directories
 images_dir = './images'
 transcriptions_dir = './transcriptions'
 
+# Downloads are network-bound, so overlap them in a small thread pool
+max_download_workers = 16
+# Scans are several MB; copy and buffer them in 1 MiB blocks
+download_chunk_size = 1 << 20
+
 os.makedirs(images_dir, exist_ok=True)
 os.makedirs(transcriptions_dir, exist_ok=True)
 
@@ -15,8 +22,9 @@ os.makedirs(transcriptions_dir, exist_ok=True)
 with open('api_responses.json', 'r') as f:
     data = json.load(f)
 
-# Extract digital objects (images) and their info
+# Extract digital objects (images) and transcriptions in a single pass
 digital_objects = []
+transcriptions = {}
 for response in data:
     url = response['url']
     resp_data = response.get('data', {})
@@ -32,15 +40,7 @@ for response in data:
                 digital_objects = objs
                 break
 
-print(f"Found {len(digital_objects)} digital objects")
-
-# Extract transcriptions - the text is in 'contribution' field
-transcriptions = {}
-for response in data:
-    url = response['url']
-    resp_data = response.get('data', {})
-
-    if 'contributions' in url and isinstance(resp_data, list):
+    elif 'contributions' in url and isinstance(resp_data, list):
         for item in resp_data:
             if item.get('contributionType') == 'transcription':
                 obj_id = str(item.get('targetObjectId'))
@@ -48,6 +48,7 @@ for response in data:
                 if obj_id and text and obj_id not in transcriptions:
                     transcriptions[obj_id] = text
 
+print(f"Found {len(digital_objects)} digital objects")
 print(f"Found {len(transcriptions)} transcriptions")
 
 # Create SSL context to handle certificates
@@ -55,28 +56,36 @@ ssl_context = ssl.create_default_context()
 ssl_context.check_hostname = False
 ssl_context.verify_mode = ssl.CERT_NONE
 
-# Download images and save transcriptions
+
+def download_image(job):
+    """Download one image and return a status message for it."""
+    i, filename, image_url, filepath = job
+    try:
+        request = urllib.request.Request(image_url, headers={'User-Agent': 'Mozilla/5.0'})
+        with urllib.request.urlopen(request, context=ssl_context, timeout=60) as response:
+            with open(filepath, 'wb', buffering=download_chunk_size) as out_file:
+                shutil.copyfileobj(response, out_file, length=download_chunk_size)
+        return f"Downloaded image {i}: {filename}\n  Saved to {filepath}"
+    except Exception as e:
+        return f"Error downloading image {i} ({filename}): {e}"
+
+
+# Queue image downloads and save transcriptions; messages are collected
+# and printed once per batch rather than line by line
+download_jobs = []
+log_lines = []
 for i, obj in enumerate(digital_objects, 1):
     obj_id = str(obj.get('objectId', ''))
     image_url = obj.get('objectUrl', '')
 
     if image_url:
-        # Download image
         filename = f"item_{i:02d}_{obj_id}.jpg"
         filepath = os.path.join(images_dir, filename)
 
         if not os.path.exists(filepath):
-            print(f"Downloading image {i}: {filename}")
-            try:
-                request = urllib.request.Request(image_url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(request, context=ssl_context, timeout=60) as response:
-                    with open(filepath, 'wb') as out_file:
-                        out_file.write(response.read())
-                print(f"  Saved to {filepath}")
-            except Exception as e:
-                print(f"  Error downloading: {e}")
+            download_jobs.append((i, filename, image_url, filepath))
         else:
-            print(f"Image {i} already exists: {filename}")
+            log_lines.append(f"Image {i} already exists: {filename}")
 
     # Save transcription
     transcription = transcriptions.get(obj_id, '')
@@ -84,13 +93,22 @@ for i, obj in enumerate(digital_objects, 1):
         trans_filename = f"item_{i:02d}_{obj_id}.txt"
         trans_filepath = os.path.join(transcriptions_dir, trans_filename)
 
-        print(f"Saving transcription {i}: {trans_filename}")
+        log_lines.append(f"Saving transcription {i}: {trans_filename}")
         with open(trans_filepath, 'w', encoding='utf-8') as f:
             f.write(transcription)
-        print(f"  Saved to {trans_filepath}")
-        print(f"  Preview: {transcription[:100]}...")
+        log_lines.append(f"  Saved to {trans_filepath}")
+        log_lines.append(f"  Preview: {transcription[:100]}...")
     else:
-        print(f"  No transcription found for object {obj_id}")
+        log_lines.append(f"  No transcription found for object {obj_id}")
+
+if log_lines:
+    print('\n'.join(log_lines))
+
+# Download images concurrently; map() keeps the messages in item order
+if download_jobs:
+    print(f"\nDownloading {len(download_jobs)} images...")
+    with ThreadPoolExecutor(max_workers=max_download_workers) as executor:
+        print('\n'.join(executor.map(download_image, download_jobs)))
 
 print("\nDone!")
 print(f"Images saved to: {images_dir}")
@@ -98,11 +116,11 @@ print(f"Transcriptions saved to: {transcriptions_dir}")
 
 # List contents
 print(f"\nImages folder contents:")
-for f in sorted(os.listdir(images_dir)):
-    size = os.path.getsize(os.path.join(images_dir, f))
-    print(f"  {f} ({size:,} bytes)")
+with os.scandir(images_dir) as it:
+    entries = sorted(it, key=lambda e: e.name)
+print('\n'.join(f"  {e.name} ({e.stat().st_size:,} bytes)" for e in entries))
 
 print(f"\nTranscriptions folder contents:")
-for f in sorted(os.listdir(transcriptions_dir)):
-    size = os.path.getsize(os.path.join(transcriptions_dir, f))
-    print(f"  {f} ({size:,} bytes)")
+with os.scandir(transcriptions_dir) as it:
+    entries = sorted(it, key=lambda e: e.name)
+print('\n'.join(f"  {e.name} ({e.stat().st_size:,} bytes)" for e in entries))
@@ -8,18 +8,26 @@ existing transcriptions, generating HTML comparison reports.
 
 import argparse
 import base64
+import hashlib
 import os
 import re
 import sys
 import json
-import difflib
 import string
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
+from html import escape as _esc
 from dotenv import load_dotenv
 from mistralai import Mistral
 
+try:
+    # C implementation of difflib.SequenceMatcher with identical results
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher as _SequenceMatcher
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -40,54 +48,179 @@ class CompareOptions:
         return ", ".join(opts) if opts else "exact matching"
 
 
+# Deletes ASCII punctuation in a single C-level pass over the text
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+
 def normalize_text(text: str, options: CompareOptions) -> str:
     """Normalize text based on comparison options."""
     if options.ignore_case:
         text = text.lower()
     if options.ignore_punctuation:
-        # Remove punctuation but keep spaces and alphanumeric
-        text = re.sub(r'[^\w\s]', '', text)
+        text = text.translate(_PUNCT_TABLE)
     return text
 
 
-def normalize_word(word: str, options: CompareOptions) -> str:
-    """Normalize a single word based on comparison options."""
-    if options.ignore_case:
-        word = word.lower()
-    if options.ignore_punctuation:
-        word = word.strip(string.punctuation)
-    return word
+def split_words(text: str, options: CompareOptions) -> tuple:
+    """Split text into original and normalized words, aligned by index.
+
+    The text is normalized once as a whole rather than word by word.
+    Punctuation-only tokens vanish from the normalized words, so they are
+    dropped from the original words as well. The normalized words are
+    interned, so repeated words share one object and SequenceMatcher's
+    lookups usually succeed on the identity check.
+    """
+    words_orig = text.split()
+    words_norm = list(map(sys.intern, normalize_text(text, options).split()))
+    if len(words_norm) != len(words_orig):
+        words_orig = [w for w in words_orig if w.translate(_PUNCT_TABLE)]
+    assert len(words_orig) == len(words_norm)
+    return words_orig, words_norm
+
+
+# Paragraph breaks: a blank line, possibly containing whitespace
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+
+# Documents longer than this (in words) are diffed paragraph by paragraph
+_SEGMENT_MIN_WORDS = 2000
+
+
+def _segment(text: str) -> list:
+    """Split text into its non-empty paragraphs."""
+    return [seg for seg in _PARAGRAPH_RE.split(text) if seg.strip()]
+
+
+def word_opcodes(text1: str, text2: str, words1_norm: list, words2_norm: list,
+                 options: CompareOptions) -> list:
+    """Return word-level opcodes aligning two texts' normalized words.
+
+    SequenceMatcher is quadratic in the worst case, so long documents are
+    first aligned paragraph by paragraph on a short key (the first 40
+    normalized characters). Paragraphs whose keys match anchor the two
+    texts, and only the words between consecutive anchors are diffed
+    against each other, so a paragraph split or merged by the OCR is still
+    diffed as one run. The opcodes index into the whole-document word
+    lists either way.
+    """
+    if max(len(words1_norm), len(words2_norm)) <= _SEGMENT_MIN_WORDS:
+        return _SequenceMatcher(None, words1_norm, words2_norm).get_opcodes()
+
+    segs1 = [split_words(seg, options)[1] for seg in _segment(text1)]
+    segs2 = [split_words(seg, options)[1] for seg in _segment(text2)]
+    keys1 = [' '.join(seg)[:40] for seg in segs1]
+    keys2 = [' '.join(seg)[:40] for seg in segs2]
+
+    # Word offset of each paragraph within its whole document
+    offsets1 = [0]
+    for seg in segs1:
+        offsets1.append(offsets1[-1] + len(seg))
+    offsets2 = [0]
+    for seg in segs2:
+        offsets2.append(offsets2[-1] + len(seg))
+
+    # Paragraph index pairs that start together, bracketed by both ends
+    anchors = [(0, 0)]
+    for a, b, size in _SequenceMatcher(None, keys1, keys2, autojunk=False).get_matching_blocks():
+        anchors.extend((a + k, b + k) for k in range(size))
+    anchors.append((len(segs1), len(segs2)))
+
+    opcodes = []
+    for (a1, b1), (a2, b2) in zip(anchors, anchors[1:]):
+        if a1 == a2 and b1 == b2:
+            continue
+        # Diff paragraphs segs1[a1:a2] against segs2[b1:b2] as one run
+        o1, o2 = offsets1[a1], offsets2[b1]
+        words1 = words1_norm[o1:offsets1[a2]]
+        words2 = words2_norm[o2:offsets2[b2]]
+        for tag, i1, i2, j1, j2 in _SequenceMatcher(None, words1, words2).get_opcodes():
+            opcodes.append((tag, i1 + o1, i2 + o1, j1 + o2, j2 + o2))
+
+    return opcodes
 
 # Directories
 IMAGES_DIR = Path("./images")
 TRANSCRIPTIONS_DIR = Path("./transcriptions")
 OCR_OUTPUT_DIR = Path("./ocr_output")
 COMPARISONS_DIR = Path("./comparisons")
+# OCR results keyed by image content, so renamed or duplicate images reuse them
+OCR_CACHE_DIR = OCR_OUTPUT_DIR / "cache"
+
+OCR_MODEL = "mistral-ocr-latest"
 
 # Create output directories
 OCR_OUTPUT_DIR.mkdir(exist_ok=True)
+OCR_CACHE_DIR.mkdir(exist_ok=True)
 COMPARISONS_DIR.mkdir(exist_ok=True)
 
 
 def encode_image(file_path: Path) -> str:
-    """Encode an image file to base64."""
-    with open(file_path, "rb") as img_file:
-        return base64.standard_b64encode(img_file.read()).decode("utf-8")
+    """Encode an image file to base64.
+
+    The file is encoded in chunks so the raw bytes are never held in memory
+    alongside their encoding. The chunk size is a multiple of 3, so no
+    padding is emitted mid-stream.
+    """
+    encoded = bytearray()
+    with open(file_path, "rb", buffering=1 << 20) as img_file:
+        while chunk := img_file.read(57 * 1024):
+            encoded += base64.standard_b64encode(chunk)
+    return encoded.decode("ascii")
+
+
+def _image_key(image_path: Path) -> str:
+    """Return the OCR cache key for an image: SHA-256 of its bytes and the model."""
+    # file_digest streams the file through the digest without reading it
+    # into memory first
+    with open(image_path, "rb") as img_file:
+        h = hashlib.file_digest(img_file, "sha256")
+    h.update(OCR_MODEL.encode())
+    return h.hexdigest()
+
+
+def _comparison_fingerprint(source_text: str, ocr_text: str, options: CompareOptions) -> str:
+    """Return a fingerprint of a comparison's inputs: SHA-256 of both texts and the options."""
+    h = hashlib.sha256()
+    for part in (source_text, ocr_text, repr(options)):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
 
 
 def run_ocr(client: Mistral, image_path: Path) -> str:
     """Run Mistral OCR on an image and return the extracted text."""
     print(f"  Running OCR on {image_path.name}...")
 
-    base64_image = encode_image(image_path)
-
-    ocr_response = client.ocr.process(
-        model="mistral-ocr-latest",
-        document={
+    # Upload the raw image and reference it by file id, which avoids the
+    # base64 data URI (a third larger) in the request body
+    file_id = None
+    try:
+        with open(image_path, "rb") as img_file:
+            uploaded = client.files.upload(
+                file={
+                    "file_name": image_path.name,
+                    "content": img_file,
+                    "content_type": "image/jpeg",
+                },
+                purpose="ocr",
+            )
+        file_id = uploaded.id
+        document = {"type": "file", "file_id": file_id}
+    except Exception as e:
+        print(f"  File upload failed ({e}), sending image inline")
+        base64_image = encode_image(image_path)
+        document = {
             "type": "image_url",
             "image_url": f"data:image/jpeg;base64,{base64_image}"
         }
-    )
+
+    try:
+        ocr_response = client.ocr.process(model=OCR_MODEL, document=document)
+    finally:
+        if file_id is not None:
+            try:
+                client.files.delete(file_id=file_id)
+            except Exception as e:
+                print(f"  Warning: could not delete uploaded file {file_id}: {e}")
 
     # Extract text from OCR response
     text_parts = []
@@ -101,38 +234,31 @@ def run_ocr(client: Mistral, image_path: Path) -> str:
     return "\n".join(text_parts)
 
 
-def diff_texts(text1: str, text2: str, options: CompareOptions = None) -> tuple:
+# Differences kept per item and listed on its comparison page
+_MAX_DIFFERENCES = 100
+
+
+def diff_texts(text1: str, text2: str, options: CompareOptions = None,
+               max_differences: int = _MAX_DIFFERENCES) -> tuple:
     """Compare two texts word by word and return stats and differences.
 
     Args:
         text1: Source/reference text
         text2: OCR output text
         options: Comparison options (ignore_case, ignore_punctuation)
+        max_differences: Keep only the first this many differences; the
+            stats still count all of them
 
     Returns:
-        Tuple of (stats dict, differences list)
+        Tuple of (stats dict, differences list, source words, OCR words,
+        word-level opcodes). The words are the original (un-normalized)
+        tokens the opcodes index into, for reuse by generate_comparison_html.
     """
     if options is None:
         options = CompareOptions()
 
-    words1_orig = text1.split()
-    words2_orig = text2.split()
-
-    # Create normalized versions for comparison
-    words1_norm = [normalize_word(w, options) for w in words1_orig]
-    words2_norm = [normalize_word(w, options) for w in words2_orig]
-
-    # Filter out empty words (can happen with punctuation-only tokens)
-    if options.ignore_punctuation:
-        filtered1 = [(orig, norm) for orig, norm in zip(words1_orig, words1_norm) if norm]
-        filtered2 = [(orig, norm) for orig, norm in zip(words2_orig, words2_norm) if norm]
-        words1_orig = [f[0] for f in filtered1]
-        words1_norm = [f[1] for f in filtered1]
-        words2_orig = [f[0] for f in filtered2]
-        words2_norm = [f[1] for f in filtered2]
-
-    # Use normalized words for matching
-    matcher = difflib.SequenceMatcher(None, words1_norm, words2_norm)
+    words1_orig, words1_norm = split_words(text1, options)
+    words2_orig, words2_norm = split_words(text2, options)
 
     stats = {
         'equal': 0,
@@ -144,9 +270,19 @@ def diff_texts(text1: str, text2: str, options: CompareOptions = None) -> tuple:
         'total_words2': len(words2_norm),
     }
 
+    if words1_norm == words2_norm:
+        # Identical after normalization: nothing to diff
+        n = len(words1_norm)
+        stats['equal'] = n
+        opcodes = [('equal', 0, n, 0, n)] if n else []
+        return stats, [], words1_orig, words2_orig, opcodes
+
+    # Use normalized words for matching
+    opcodes = word_opcodes(text1, text2, words1_norm, words2_norm, options)
+
     differences = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == 'equal':
             stats['equal'] += (i2 - i1)
         elif tag == 'replace':
@@ -159,30 +295,126 @@ def diff_texts(text1: str, text2: str, options: CompareOptions = None) -> tuple:
                 for w1_orig, w1_norm, w2_orig, w2_norm in zip(
                     src_words_orig, src_words_norm, ocr_words_orig, ocr_words_norm
                 ):
-                    ratio = difflib.SequenceMatcher(None, w1_norm, w2_norm).ratio()
-                    if ratio > 0.5:
-                        stats['similar'] += 1
-                        differences.append((w1_orig, w2_orig, 'similar'))
+                    sm = _SequenceMatcher(None, w1_norm, w2_norm)
+                    # real_quick_ratio/quick_ratio are cheap upper bounds on
+                    # ratio(); not worth checking first for very short words
+                    if len(w1_norm) + len(w2_norm) > 8 and (
+                        sm.real_quick_ratio() <= 0.5 or sm.quick_ratio() <= 0.5
+                    ):
+                        ratio = 0.0
                     else:
-                        stats['replaced'] += 1
-                        differences.append((w1_orig, w2_orig, 'replaced'))
+                        ratio = sm.ratio()
+                    diff_type = 'similar' if ratio > 0.5 else 'replaced'
+                    stats[diff_type] += 1
+                    if len(differences) < max_differences:
+                        differences.append((w1_orig, w2_orig, diff_type))
             else:
-                for w in src_words_orig:
-                    stats['deleted'] += 1
-                    differences.append((w, '', 'deleted'))
-                for w in ocr_words_orig:
-                    stats['inserted'] += 1
-                    differences.append(('', w, 'inserted'))
+                stats['deleted'] += i2 - i1
+                stats['inserted'] += j2 - j1
+                differences.extend((w, '', 'deleted') for w in src_words_orig[:max_differences - len(differences)])
+                differences.extend(('', w, 'inserted') for w in ocr_words_orig[:max_differences - len(differences)])
         elif tag == 'delete':
-            for w in words1_orig[i1:i2]:
-                stats['deleted'] += 1
-                differences.append((w, '', 'deleted'))
+            stats['deleted'] += i2 - i1
+            differences.extend((w, '', 'deleted') for w in words1_orig[i1:i2][:max_differences - len(differences)])
         elif tag == 'insert':
-            for w in words2_orig[j1:j2]:
-                stats['inserted'] += 1
-                differences.append(('', w, 'inserted'))
+            stats['inserted'] += j2 - j1
+            differences.extend(('', w, 'inserted') for w in words2_orig[j1:j2][:max_differences - len(differences)])
+
+    return stats, differences, words1_orig, words2_orig, opcodes
+
+
+# Static parts of the comparison page
+_COMPARISON_HEAD = """    <style>
+        body { font-family: Georgia, serif; margin: 20px; background: #f5f5f5; line-height: 1.6; }
+        .container { max-width: 1400px; margin: 0 auto; }
+        h1 { color: #333; text-align: center; }
+        h2 { color: #555; }
+        .panel { background: white; padding: 20px; margin: 15px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .panel h2 { margin-top: 0; color: #444; border-bottom: 2px solid #007acc; padding-bottom: 10px; }
+        .text { line-height: 2; font-size: 16px; white-space: pre-wrap; }
+        .error { background: #fff3cd; border-bottom: 2px solid #ffc107; cursor: help; }
+        .deleted { background: #f8d7da; text-decoration: line-through; color: #721c24; }
+        .inserted { background: #d4edda; color: #155724; }
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 15px; }
+        .stat-box { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; text-align: center; }
+        .stat-box.good { background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); }
+        .stat-box.warn { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }
+        .stat-box .value { font-size: 28px; font-weight: bold; }
+        .stat-box .label { font-size: 12px; opacity: 0.9; text-transform: uppercase; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { padding: 8px 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background: #f8f9fa; }
+        tr.similar td { background: #fff3cd; }
+        tr.replaced td { background: #ffe6e6; }
+        tr.deleted td { background: #f8d7da; }
+        tr.inserted td { background: #d4edda; }
+        .legend { display: flex; gap: 20px; flex-wrap: wrap; padding: 10px; background: #f8f9fa; border-radius: 5px; }
+        .legend-item { display: flex; align-items: center; gap: 5px; }
+        .legend-color { width: 20px; height: 20px; border-radius: 3px; }
+        .image-preview { max-width: 100%; max-height: 400px; border: 1px solid #ddd; }
+        .side-by-side { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }
+        @media (max-width: 900px) { .side-by-side { grid-template-columns: 1fr; } }
+        .nav { text-align: center; margin: 20px 0; }
+        .nav a { margin: 0 10px; color: #007acc; text-decoration: none; }
+        .nav a:hover { text-decoration: underline; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="nav">
+            <a href="summary_report.html">← Back to Summary</a>
+        </div>
+
+"""
+
+_COMPARISON_TAIL = """
+        <div class="nav">
+            <a href="summary_report.html">← Back to Summary</a>
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+# Body of the comparison page when the normalized texts are identical
+_PERFECT_MATCH_TPL = """        <h1>OCR Comparison: {item_name}</h1>
+
+        <div class="panel">
+            <h2>Perfect Match</h2>
+            <p>The OCR output matches the source transcription word for word ({words} words).</p>
+            <p><strong>Options:</strong> {options}</p>
+        </div>
+
+        <div class="panel">
+            <h2>Source Image</h2>
+            <img src="../images/{image_name}" alt="{item_name}" class="image-preview">
+        </div>
+"""
+
+# Per-word markup in the side-by-side panels
+_ERR_SRC_TPL = '<span class="error" title="OCR: {1}">{0}</span>'
+_ERR_OCR_TPL = '<span class="error" title="Source: {1}">{0}</span>'
+_DEL_TPL = '<span class="deleted">{0}</span>'
+_INS_TPL = '<span class="inserted">{0}</span>'
+
+
+def _difference_rows(differences: list, total: int):
+    """Yield the differences table rows, limited to the first _MAX_DIFFERENCES of total."""
+    shown = differences[:_MAX_DIFFERENCES]
+    for i, (src, ocr, diff_type) in enumerate(shown, 1):
+        src_escaped = _esc(src)
+        ocr_escaped = _esc(ocr)
+        if diff_type == 'similar':
+            yield f'<tr class="similar"><td>{i}</td><td>{src_escaped}</td><td>→</td><td>{ocr_escaped}</td></tr>'
+        elif diff_type == 'replaced':
+            yield f'<tr class="replaced"><td>{i}</td><td>{src_escaped}</td><td>→</td><td>{ocr_escaped}</td></tr>'
+        elif diff_type == 'deleted':
+            yield f'<tr class="deleted"><td>{i}</td><td>{src_escaped}</td><td>→</td><td>(deleted)</td></tr>'
+        elif diff_type == 'inserted':
+            yield f'<tr class="inserted"><td>{i}</td><td>(none)</td><td>→</td><td>{ocr_escaped}</td></tr>'
 
-    return stats, differences
+    if total > len(shown):
+        yield f'<tr><td colspan="4"><em>... and {total - len(shown)} more differences</em></td></tr>'
 
 
 def generate_comparison_html(
@@ -193,33 +425,37 @@ def generate_comparison_html(
     stats: dict,
     differences: list,
     output_file: Path,
-    options: CompareOptions = None
+    options: CompareOptions = None,
+    words1: list = None,
+    words2: list = None,
+    opcodes: list = None
 ):
-    """Generate an HTML comparison report."""
+    """Generate an HTML comparison report.
+
+    Pass the words and opcodes returned by diff_texts to reuse its
+    alignment; when they are omitted the texts are diffed again here.
+    """
     if options is None:
         options = CompareOptions()
 
-    words1 = source_text.split()
-    words2 = ocr_text.split()
-
-    # Normalize for matching (same as diff_texts)
-    words1_norm = [normalize_word(w, options) for w in words1]
-    words2_norm = [normalize_word(w, options) for w in words2]
-
-    if options.ignore_punctuation:
-        filtered1 = [(orig, norm) for orig, norm in zip(words1, words1_norm) if norm]
-        filtered2 = [(orig, norm) for orig, norm in zip(words2, words2_norm) if norm]
-        words1 = [f[0] for f in filtered1]
-        words1_norm = [f[1] for f in filtered1]
-        words2 = [f[0] for f in filtered2]
-        words2_norm = [f[1] for f in filtered2]
+    if opcodes is None:
+        # Normalize for matching (same as diff_texts)
+        words1, words1_norm = split_words(source_text, options)
+        words2, words2_norm = split_words(ocr_text, options)
+        opcodes = word_opcodes(source_text, ocr_text, words1_norm, words2_norm, options)
 
-    matcher = difflib.SequenceMatcher(None, words1_norm, words2_norm)
+    # Escape every word once up front; the spans below only wrap them
+    words1 = list(map(_esc, words1))
+    words2 = list(map(_esc, words2))
 
     html_text1 = []
     html_text2 = []
+    err_src = _ERR_SRC_TPL.format
+    err_ocr = _ERR_OCR_TPL.format
+    deleted = _DEL_TPL.format
+    inserted = _INS_TPL.format
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == 'equal':
             html_text1.extend(words1[i1:i2])
             html_text2.extend(words2[j1:j2])
@@ -228,87 +464,30 @@ def generate_comparison_html(
             ocr_words = words2[j1:j2]
             if len(src_words) == len(ocr_words):
                 for w1, w2 in zip(src_words, ocr_words):
-                    html_text1.append(f'<span class="error" title="OCR: {w2}">{w1}</span>')
-                    html_text2.append(f'<span class="error" title="Source: {w1}">{w2}</span>')
+                    html_text1.append(err_src(w1, w2))
+                    html_text2.append(err_ocr(w2, w1))
             else:
-                for w in src_words:
-                    html_text1.append(f'<span class="deleted">{w}</span>')
-                for w in ocr_words:
-                    html_text2.append(f'<span class="inserted">{w}</span>')
+                html_text1.extend(map(deleted, src_words))
+                html_text2.extend(map(inserted, ocr_words))
         elif tag == 'delete':
-            for w in words1[i1:i2]:
-                html_text1.append(f'<span class="deleted">{w}</span>')
+            html_text1.extend(map(deleted, words1[i1:i2]))
         elif tag == 'insert':
-            for w in words2[j1:j2]:
-                html_text2.append(f'<span class="inserted">{w}</span>')
-
-    # Generate differences table
-    diff_rows = []
-    for i, (src, ocr, diff_type) in enumerate(differences[:100], 1):  # Limit to 100
-        src_escaped = src.replace('<', '&lt;').replace('>', '&gt;')
-        ocr_escaped = ocr.replace('<', '&lt;').replace('>', '&gt;')
-        if diff_type == 'similar':
-            diff_rows.append(f'<tr class="similar"><td>{i}</td><td>{src_escaped}</td><td>→</td><td>{ocr_escaped}</td></tr>')
-        elif diff_type == 'replaced':
-            diff_rows.append(f'<tr class="replaced"><td>{i}</td><td>{src_escaped}</td><td>→</td><td>{ocr_escaped}</td></tr>')
-        elif diff_type == 'deleted':
-            diff_rows.append(f'<tr class="deleted"><td>{i}</td><td>{src_escaped}</td><td>→</td><td>(deleted)</td></tr>')
-        elif diff_type == 'inserted':
-            diff_rows.append(f'<tr class="inserted"><td>{i}</td><td>(none)</td><td>→</td><td>{ocr_escaped}</td></tr>')
-
-    if len(differences) > 100:
-        diff_rows.append(f'<tr><td colspan="4"><em>... and {len(differences) - 100} more differences</em></td></tr>')
+            html_text2.extend(map(inserted, words2[j1:j2]))
 
     accuracy = (stats['equal'] / stats['total_words1'] * 100) if stats['total_words1'] > 0 else 0
     total_errors = stats['similar'] + stats['replaced'] + stats['deleted'] + stats['inserted']
 
-    html = f"""<!DOCTYPE html>
+    # Write the report section by section straight to the file rather than
+    # interpolating the large joined panels into a single f-string
+    with output_file.open('w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>OCR Comparison - {item_name}</title>
-    <style>
-        body {{ font-family: Georgia, serif; margin: 20px; background: #f5f5f5; line-height: 1.6; }}
-        .container {{ max-width: 1400px; margin: 0 auto; }}
-        h1 {{ color: #333; text-align: center; }}
-        h2 {{ color: #555; }}
-        .panel {{ background: white; padding: 20px; margin: 15px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .panel h2 {{ margin-top: 0; color: #444; border-bottom: 2px solid #007acc; padding-bottom: 10px; }}
-        .text {{ line-height: 2; font-size: 16px; white-space: pre-wrap; }}
-        .error {{ background: #fff3cd; border-bottom: 2px solid #ffc107; cursor: help; }}
-        .deleted {{ background: #f8d7da; text-decoration: line-through; color: #721c24; }}
-        .inserted {{ background: #d4edda; color: #155724; }}
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 15px; }}
-        .stat-box {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; text-align: center; }}
-        .stat-box.good {{ background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); }}
-        .stat-box.warn {{ background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }}
-        .stat-box .value {{ font-size: 28px; font-weight: bold; }}
-        .stat-box .label {{ font-size: 12px; opacity: 0.9; text-transform: uppercase; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th, td {{ padding: 8px 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background: #f8f9fa; }}
-        tr.similar td {{ background: #fff3cd; }}
-        tr.replaced td {{ background: #ffe6e6; }}
-        tr.deleted td {{ background: #f8d7da; }}
-        tr.inserted td {{ background: #d4edda; }}
-        .legend {{ display: flex; gap: 20px; flex-wrap: wrap; padding: 10px; background: #f8f9fa; border-radius: 5px; }}
-        .legend-item {{ display: flex; align-items: center; gap: 5px; }}
-        .legend-color {{ width: 20px; height: 20px; border-radius: 3px; }}
-        .image-preview {{ max-width: 100%; max-height: 400px; border: 1px solid #ddd; }}
-        .side-by-side {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }}
-        @media (max-width: 900px) {{ .side-by-side {{ grid-template-columns: 1fr; }} }}
-        .nav {{ text-align: center; margin: 20px 0; }}
-        .nav a {{ margin: 0 10px; color: #007acc; text-decoration: none; }}
-        .nav a:hover {{ text-decoration: underline; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="nav">
-            <a href="summary_report.html">← Back to Summary</a>
-        </div>
-
-        <h1>OCR Comparison: {item_name}</h1>
+""")
+        f.write(_COMPARISON_HEAD)
+        f.write(f"""        <h1>OCR Comparison: {item_name}</h1>
 
         <div class="panel">
             <h2>Comparison Mode</h2>
@@ -360,66 +539,100 @@ def generate_comparison_html(
         <div class="side-by-side">
             <div class="panel">
                 <h2>Source Transcription</h2>
-                <div class="text">{' '.join(html_text1)}</div>
+                <div class="text">""")
+        f.write(' '.join(html_text1))
+        f.write("""</div>
             </div>
 
             <div class="panel">
                 <h2>Mistral OCR Output</h2>
-                <div class="text">{' '.join(html_text2)}</div>
+                <div class="text">""")
+        f.write(' '.join(html_text2))
+        f.write(f"""</div>
             </div>
         </div>
 
         <div class="panel">
-            <h2>Differences List ({len(differences)} items)</h2>
+            <h2>Differences List ({total_errors} items)</h2>
             <table>
                 <tr><th>#</th><th>Source</th><th></th><th>OCR</th></tr>
-                {''.join(diff_rows) if diff_rows else '<tr><td colspan="4">No differences found!</td></tr>'}
+                """)
+        if differences:
+            f.writelines(_difference_rows(differences, total_errors))
+        else:
+            f.write('<tr><td colspan="4">No differences found!</td></tr>')
+        f.write("""
             </table>
         </div>
+""")
+        f.write(_COMPARISON_TAIL)
 
-        <div class="nav">
-            <a href="summary_report.html">← Back to Summary</a>
-        </div>
-    </div>
-</body>
-</html>"""
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+def generate_perfect_match_html(item_name: str, image_path: Path, stats: dict,
+                                output_file: Path, options: CompareOptions = None):
+    """Generate the short comparison page for an OCR output with no differences."""
+    if options is None:
+        options = CompareOptions()
+
+    with output_file.open('w', encoding='utf-8') as f:
+        f.write(f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>OCR Comparison - {item_name}</title>
+""")
+        f.write(_COMPARISON_HEAD)
+        f.write(_PERFECT_MATCH_TPL.format(
+            item_name=item_name,
+            words=stats['total_words1'],
+            options=options.describe(),
+            image_name=image_path.name,
+        ))
+        f.write(_COMPARISON_TAIL)
+
+
+# One row of the summary report's results table
+_ROW_TPL = (
+    '                <tr><td><a href="{comparison_file}">{item_name}</a></td><td>{source_words}</td>'
+    '<td>{ocr_words}</td><td>{matches}</td><td>{errors}</td>'
+    '<td class="{accuracy_class}">{accuracy:.1f}%</td></tr>\n'
+)
 
 
 def generate_summary_report(results: list, output_file: Path, options: CompareOptions = None):
     """Generate a summary HTML report for all items."""
     if options is None:
         options = CompareOptions()
-    total_source_words = sum(r['stats']['total_words1'] for r in results)
-    total_ocr_words = sum(r['stats']['total_words2'] for r in results)
-    total_matches = sum(r['stats']['equal'] for r in results)
-    total_errors = sum(
-        r['stats']['similar'] + r['stats']['replaced'] +
-        r['stats']['deleted'] + r['stats']['inserted']
-        for r in results
-    )
-    overall_accuracy = (total_matches / total_source_words * 100) if total_source_words > 0 else 0
 
-    # Generate table rows
+    # Build the table rows and the overall totals in one pass over results
     table_rows = []
+    row = _ROW_TPL.format
+    total_source_words = total_ocr_words = total_matches = total_errors = 0
     for r in results:
-        accuracy = (r['stats']['equal'] / r['stats']['total_words1'] * 100) if r['stats']['total_words1'] > 0 else 0
-        errors = r['stats']['similar'] + r['stats']['replaced'] + r['stats']['deleted'] + r['stats']['inserted']
+        stats = r['stats']
+        errors = stats['similar'] + stats['replaced'] + stats['deleted'] + stats['inserted']
+        total_source_words += stats['total_words1']
+        total_ocr_words += stats['total_words2']
+        total_matches += stats['equal']
+        total_errors += errors
+        accuracy = (stats['equal'] / stats['total_words1'] * 100) if stats['total_words1'] > 0 else 0
         accuracy_class = 'good' if accuracy >= 80 else 'warn' if accuracy >= 50 else 'bad'
-        table_rows.append(f"""
-            <tr>
-                <td><a href="{r['comparison_file']}">{r['item_name']}</a></td>
-                <td>{r['stats']['total_words1']}</td>
-                <td>{r['stats']['total_words2']}</td>
-                <td>{r['stats']['equal']}</td>
-                <td>{errors}</td>
-                <td class="{accuracy_class}">{accuracy:.1f}%</td>
-            </tr>
-        """)
-
-    html = f"""<!DOCTYPE html>
+        table_rows.append(row(
+            comparison_file=r['comparison_file'],
+            item_name=r['item_name'],
+            source_words=stats['total_words1'],
+            ocr_words=stats['total_words2'],
+            matches=stats['equal'],
+            errors=errors,
+            accuracy_class=accuracy_class,
+            accuracy=accuracy,
+        ))
+
+    overall_accuracy = (total_matches / total_source_words * 100) if total_source_words > 0 else 0
+
+    # Write the report straight to the file
+    with output_file.open('w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -495,8 +708,9 @@ def generate_summary_report(results: list, output_file: Path, options: CompareOp
                     <th>Errors</th>
                     <th>Accuracy</th>
                 </tr>
-                {''.join(table_rows)}
-            </table>
+""")
+        f.writelines(table_rows)
+        f.write(f"""            </table>
         </div>
 
         <div class="panel">
@@ -506,17 +720,14 @@ def generate_summary_report(results: list, output_file: Path, options: CompareOp
             (John Hough, Va.).</p>
             <p><strong>Source:</strong> <a href="https://catalog.archives.gov/id/54928953" target="_blank">
             https://catalog.archives.gov/id/54928953</a></p>
-            <p><strong>OCR Model:</strong> mistral-ocr-latest</p>
+            <p><strong>OCR Model:</strong> {OCR_MODEL}</p>
             <p><strong>Comparison Mode:</strong> {options.describe()}</p>
         </div>
 
         <p class="meta">Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
     </div>
 </body>
-</html>"""
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+</html>""")
 
 
 def parse_args():
@@ -531,6 +742,7 @@ Examples:
   %(prog)s --ignore-punctuation      # Ignore punctuation differences
   %(prog)s -i -p                     # Both options combined
   %(prog)s --no-ocr                  # Skip OCR, compare only (use cached)
+  %(prog)s --workers 8               # Run up to 8 OCR requests at once
         """
     )
     parser.add_argument(
@@ -554,7 +766,16 @@ Examples:
         default=COMPARISONS_DIR,
         help=f'Output directory for reports (default: {COMPARISONS_DIR})'
     )
-    return parser.parse_args()
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Number of concurrent OCR requests (default: 4)'
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    return args
 
 
 def main():
@@ -586,11 +807,15 @@ def main():
     image_files = sorted(IMAGES_DIR.glob("item_*.jpg"))
     print(f"Found {len(image_files)} images to process")
 
-    results = []
+    # Resolve transcriptions and cached OCR output; images without cached
+    # OCR are queued by content key, so the API calls can run concurrently
+    # below and byte-identical images share one call
+    items = []
+    pending = {}
 
     for image_path in image_files:
         item_name = image_path.stem  # e.g., item_01_54928954
-        print(f"\nProcessing {item_name}...")
+        print(f"\nPreparing {item_name}...")
 
         # Find corresponding transcription
         trans_path = TRANSCRIPTIONS_DIR / f"{item_name}.txt"
@@ -598,53 +823,142 @@ def main():
             print(f"  Warning: No transcription found for {item_name}")
             continue
 
-        # Read source transcription
-        with open(trans_path, 'r', encoding='utf-8') as f:
-            source_text = f.read().strip()
+        # Read source transcription; no strip() needed since the
+        # comparison splits on whitespace anyway
+        source_text = trans_path.read_text(encoding='utf-8')
 
-        # Check for cached OCR output
+        # Check for cached OCR output, by image content first and then by
+        # the per-item file written by earlier versions
         ocr_output_path = OCR_OUTPUT_DIR / f"{item_name}_ocr.txt"
+        ocr_cache_path = OCR_CACHE_DIR / f"{_image_key(image_path)}.txt"
+
+        item = {
+            'item_name': item_name,
+            'image_path': image_path,
+            'source_text': source_text,
+            'ocr_text': None,
+        }
+
+        # The per-item file is tracked in git, so a newer one (e.g. from a
+        # pull) takes precedence over the local content-keyed entry
+        cache_is_current = ocr_cache_path.exists() and not (
+            ocr_output_path.exists()
+            and ocr_output_path.stat().st_mtime > ocr_cache_path.stat().st_mtime
+        )
 
-        if ocr_output_path.exists():
+        if cache_is_current:
             print(f"  Using cached OCR output")
-            with open(ocr_output_path, 'r', encoding='utf-8') as f:
-                ocr_text = f.read().strip()
+            item['ocr_text'] = ocr_cache_path.read_text(encoding='utf-8')
+        elif ocr_output_path.exists():
+            print(f"  Using cached OCR output")
+            item['ocr_text'] = ocr_output_path.read_text(encoding='utf-8')
+            # Backfill (or refresh) the content-keyed cache so renamed
+            # copies hit it
+            ocr_cache_path.write_text(item['ocr_text'], encoding='utf-8')
         elif args.no_ocr:
             print(f"  No cached OCR output found, skipping (--no-ocr mode)")
             continue
         else:
-            # Run OCR
-            try:
-                ocr_text = run_ocr(client, image_path)
-                # Save OCR output
-                with open(ocr_output_path, 'w', encoding='utf-8') as f:
-                    f.write(ocr_text)
-                print(f"  OCR complete, saved to {ocr_output_path}")
-            except Exception as e:
-                print(f"  Error running OCR: {e}")
-                continue
+            pending.setdefault(ocr_cache_path, []).append((item, ocr_output_path))
+
+        items.append(item)
+
+    # Run OCR for uncached images; the calls are network-bound, so a thread
+    # pool overlaps them
+    if pending:
+        print(f"\nRunning OCR on {len(pending)} images with {args.workers} workers...")
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(run_ocr, client, copies[0][0]['image_path']): (ocr_cache_path, copies)
+                for ocr_cache_path, copies in pending.items()
+            }
+            for future in as_completed(futures):
+                ocr_cache_path, copies = futures[future]
+                try:
+                    ocr_text = future.result()
+                except Exception as e:
+                    names = ', '.join(item['item_name'] for item, _ in copies)
+                    print(f"  Error running OCR on {names}: {e}")
+                    continue
+                # Save OCR output for every copy of the image; the cache
+                # entry goes last so it is not older than the per-item files
+                for item, ocr_output_path in copies:
+                    ocr_output_path.write_text(ocr_text, encoding='utf-8')
+                    item['ocr_text'] = ocr_text
+                    print(f"  OCR complete, saved to {ocr_output_path}")
+                ocr_cache_path.write_text(ocr_text, encoding='utf-8')
+
+    # Results of the previous run into this directory, so comparisons whose
+    # inputs are unchanged can be reused instead of diffed and rendered again
+    previous = {}
+    try:
+        with open(output_dir / "results.json", 'r') as f:
+            previous_json = json.load(f)
+    except (OSError, ValueError):
+        previous_json = None
+    # Older versions wrote a bare list without fingerprints; anything not in
+    # the current shape counts as no previous results
+    if isinstance(previous_json, dict) and isinstance(previous_json.get('results'), list):
+        for r in previous_json['results']:
+            if (isinstance(r, dict) and isinstance(r.get('item_name'), str)
+                    and isinstance(r.get('fingerprint'), str)
+                    and isinstance(r.get('stats'), dict)):
+                previous[r['item_name']] = r
+
+    results = []
+
+    for item in items:
+        item_name = item['item_name']
+        image_path = item['image_path']
+        source_text = item['source_text']
+        ocr_text = item['ocr_text']
+        if ocr_text is None:
+            # OCR failed above
+            continue
+        print(f"\nComparing {item_name}...")
+
+        comparison_file = f"{item_name}_comparison.html"
+        comparison_path = output_dir / comparison_file
+        fingerprint = _comparison_fingerprint(source_text, ocr_text, options)
+
+        prev = previous.get(item_name)
+        if prev and prev['fingerprint'] == fingerprint and comparison_path.exists():
+            stats = prev['stats']
+            accuracy = (stats['equal'] / stats['total_words1'] * 100) if stats['total_words1'] > 0 else 0
+            print(f"  Accuracy: {accuracy:.1f}% ({stats['equal']}/{stats['total_words1']} words)")
+            print(f"  Unchanged since last run, keeping {comparison_path}")
+            results.append({
+                'item_name': item_name,
+                'image_path': image_path,
+                'stats': stats,
+                'comparison_file': comparison_file,
+                'fingerprint': fingerprint
+            })
+            continue
 
         # Compare texts
-        stats, differences = diff_texts(source_text, ocr_text, options)
+        stats, differences, words1, words2, opcodes = diff_texts(source_text, ocr_text, options)
 
         accuracy = (stats['equal'] / stats['total_words1'] * 100) if stats['total_words1'] > 0 else 0
         print(f"  Accuracy: {accuracy:.1f}% ({stats['equal']}/{stats['total_words1']} words)")
 
-        # Generate HTML comparison
-        comparison_file = f"{item_name}_comparison.html"
-        comparison_path = output_dir / comparison_file
-        generate_comparison_html(
-            item_name, image_path, source_text, ocr_text,
-            stats, differences, comparison_path, options
-        )
+        # Generate HTML comparison; a perfect match gets the short page
+        if stats['equal'] == stats['total_words1'] == stats['total_words2']:
+            generate_perfect_match_html(item_name, image_path, stats, comparison_path, options)
+        else:
+            generate_comparison_html(
+                item_name, image_path, source_text, ocr_text,
+                stats, differences, comparison_path, options,
+                words1=words1, words2=words2, opcodes=opcodes
+            )
         print(f"  Comparison saved to {comparison_path}")
 
         results.append({
             'item_name': item_name,
             'image_path': image_path,
             'stats': stats,
-            'differences': differences,
-            'comparison_file': comparison_file
+            'comparison_file': comparison_file,
+            'fingerprint': fingerprint
         })
 
     # Generate summary report
@@ -668,7 +982,8 @@ def main():
         json_results['results'].append({
             'item_name': r['item_name'],
             'stats': r['stats'],
-            'comparison_file': r['comparison_file']
+            'comparison_file': r['comparison_file'],
+            'fingerprint': r['fingerprint']
         })
 
     with open(output_dir / "results.json", 'w') as f: